@@ -4,12 +4,11 @@ import pandas as pd
 import asyncio
 from datetime import datetime
 
-from db import init_db, load_all_lots
-from export import export_to_excel_rus
+from queries import load_all_lots
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
 
-# ⚠️ ВАЖНО: в sync.py должны быть эти функции
-from sync import run_incremental_parser, run_full_parser
+# Парсер (aiohttp, BeautifulSoup) и экспорт (openpyxl) импортируются лениво —
+# только при нажатии соответствующих кнопок, чтобы не замедлять старт сессии
 
 # =============================
 # Конфиг / версия
@@ -19,11 +18,6 @@ __version__ = "0.4.0"
 st.set_page_config(page_title=f"Парсер закупок med.ecc.kz v{__version__}", layout="wide")
 st.title(f"📦 Парсер закупок med.ecc.kz v{__version__}")
 
-# =============================
-# Инициализация БД
-# =============================
-init_db()
-
 # =============================
 # Кэш загрузки всех данных
 # =============================
@@ -94,6 +88,7 @@ with st.sidebar:
         col_ok, col_cancel = st.columns(2)
         with col_ok:
             if st.button("Да, выполнить"):
+                from sync import run_full_parser
                 with st.spinner("Идёт ПОЛНОЕ обновление (все страницы)..."):
                     # run_full_parser без параметров: идём до пустой страницы
                     new_lots, log_path = asyncio.run(run_full_parser())
@@ -106,6 +101,7 @@ with st.sidebar:
                 st.session_state.confirm_full = False
 
     if st.button("Обновить БД (только новые)"):
+        from sync import run_incremental_parser
         with st.spinner("Идёт обновление базы (только новые)..."):
             # Функция должна вернуть (new_lots, log_path)
             new_lots, log_path = asyncio.run(run_incremental_parser(max_pages))
@@ -266,6 +262,7 @@ st.subheader("📊 Экспорт данных")
 col1, col2 = st.columns(2)
 with col1:
     if st.button("📥 Скачать Excel (все отфильтрованные)"):
+        from export import export_to_excel_rus
         excel_file = export_to_excel_rus()
         with open(excel_file, "rb") as file:
             st.download_button(
@@ -0,0 +1,54 @@
+# bench_parallel.py
+"""
+Замер ускорения run_partitioned_full_parser на локальной заглушке сайта.
+
+    python bench_parallel.py [макс_запросов_в_сек]
+
+Для 1, 2 и 4 воркеров поднимает standin_server, пересобирает базу во временном
+каталоге (data/ и logs/ там же) и печатает время и ускорение относительно
+одного воркера. По умолчанию общий лимит запросов выключен.
+"""
+import os
+import sys
+import tempfile
+import time
+
+import standin_server
+from parallel_sync import run_partitioned_full_parser
+
+WORKER_COUNTS = (1, 2, 4)
+
+
+def main(max_rps=None):
+    expected = standin_server.PAGES * standin_server.ANNS_PER_PAGE * standin_server.LOTS_PER_ANN
+    server, base_url = standin_server.start_server()
+    cwd = os.getcwd()
+    results = []
+    try:
+        for workers in WORKER_COUNTS:
+            with tempfile.TemporaryDirectory() as tmp:
+                os.chdir(tmp)
+                try:
+                    started = time.perf_counter()
+                    count, _ = run_partitioned_full_parser(
+                        workers, base_url=base_url, max_rps=max_rps
+                    )
+                    elapsed = time.perf_counter() - started
+                finally:
+                    os.chdir(cwd)
+            if count != expected:
+                print(f"⚠️ {workers} воркер(ов): записано {count} лотов из {expected}")
+            results.append((workers, elapsed))
+    finally:
+        server.shutdown()
+
+    base = results[0][1]
+    limit = f"{max_rps:g} запр/с" if max_rps else "нет"
+    print(f"Страниц: {standin_server.PAGES}, лотов: {expected}, общий лимит: {limit}")
+    for workers, elapsed in results:
+        print(f"{workers} воркер(ов): {elapsed:6.1f} с, ускорение x{base / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    max_rps = float(sys.argv[1]) if len(sys.argv) > 1 else None
+    main(max_rps)
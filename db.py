@@ -1,15 +1,13 @@
 import sqlite3
 import os
-import pandas as pd
 
+# Без pandas: модуль нужен парсеру; чтение для дашборда — в queries.py
 DB_PATH = "data/medecc.db"
-os.makedirs("data", exist_ok=True)
 
-def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("""
-    CREATE TABLE IF NOT EXISTS lots (
+def create_lots_table(conn, table: str = "lots"):
+    """Схема таблицы лотов; table — для промежуточной таблицы при пересборке"""
+    conn.execute(f"""
+    CREATE TABLE IF NOT EXISTS {table} (
         plan_point_id TEXT,    -- № пункта плана (уникальный номер лота)
         lot_id TEXT PRIMARY KEY,
         ann_id TEXT,
@@ -27,6 +25,11 @@ def init_db():
         status TEXT
     );
     """)
+
+def init_db():
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(DB_PATH)
+    create_lots_table(conn)
     conn.commit()
     conn.close()
 
@@ -39,6 +42,19 @@ def insert_lot(lot: dict):
     conn.commit()
     conn.close()
 
+def insert_lots(lots: list, conn=None, table: str = "lots") -> int:
+    """Пакетная вставка лотов; возвращает число реально добавленных строк"""
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(DB_PATH)
+    c = conn.executemany(f"""
+        INSERT OR IGNORE INTO {table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [tuple(lot.values()) for lot in lots])
+    conn.commit()
+    if own_conn:
+        conn.close()
+    return c.rowcount
+
 def lot_exists(lot_id: str) -> bool:
     conn = sqlite3.connect(DB_PATH)
     c = conn.cursor()
@@ -47,19 +63,16 @@ def lot_exists(lot_id: str) -> bool:
     conn.close()
     return result is not None
 
-def load_all_lots() -> pd.DataFrame:
-    conn = sqlite3.connect(DB_PATH)
-    df = pd.read_sql("SELECT * FROM lots ORDER BY ann_id, plan_point_id", conn)
-    conn.close()
-    return df
-
-def get_last_update_date():
+def count_lots() -> int:
+    if not os.path.exists(DB_PATH):
+        return 0
     conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT MAX(date_end) FROM lots")
-    result = c.fetchone()
-    conn.close()
-    return result[0] if result else None
+    try:
+        return conn.execute("SELECT COUNT(*) FROM lots").fetchone()[0]
+    except sqlite3.DatabaseError:
+        return 0
+    finally:
+        conn.close()
 
 def clear_db():
     conn = sqlite3.connect(DB_PATH)
@@ -1,6 +1,6 @@
 # export.py
 import pandas as pd
-from db import load_all_lots
+from queries import load_all_lots
 from datetime import datetime
 from openpyxl import load_workbook
 from openpyxl.styles import Font, Alignment
@@ -0,0 +1,111 @@
+# importtime_check.py
+"""
+Бюджет времени импорта для пути дашборда.
+
+    python importtime_check.py [бюджет_мс]
+
+Две проверки:
+- импорты app.py, которые выполняются при каждом запуске сессии (верхний
+  уровень модуля, включая блоки with/try, но не ветки if и не функции),
+  не должны тянуть парсер и экспорт;
+- `python -X importtime -c "import queries"` (pandas + доступ к БД для
+  дашборда) в отдельном процессе укладывается в бюджет.
+Код возврата 1 — проверка не пройдена.
+"""
+import ast
+import os
+import subprocess
+import sys
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+MODULE = "queries"
+# Замер (Python 3.11, pandas 3.0, новый процесс, без __pycache__ проекта):
+# 283–338 мс за 5 запусков; бюджет — с запасом ~2x на более медленные машины
+IMPORT_BUDGET_MS = 700
+RUNS = 3  # берём лучший из запусков: первый может включать компиляцию .pyc
+FORBIDDEN = ["sync", "parallel_sync", "export", "aiohttp", "bs4", "openpyxl"]
+
+
+def session_imports(path: str = APP):
+    """Модули, импортируемые app.py безусловно — при каждом запуске скрипта Streamlit"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    names = []
+
+    def walk(statements):
+        for node in statements:
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                names.append(node.module)
+            elif isinstance(node, (ast.With, ast.AsyncWith)):
+                walk(node.body)
+            elif isinstance(node, ast.Try):
+                walk(node.body)
+                walk(node.finalbody)
+
+    walk(tree.body)
+    return names
+
+
+def measure(module: str = MODULE):
+    """(cumulative-время импорта в мс, множество импортированных модулей).
+
+    Если модуль не импортировался, бросает RuntimeError с выводом интерпретатора.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+        cwd=os.path.dirname(APP),
+    )
+    cumulative_us = None
+    imported = set()
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        name = parts[2].strip()
+        if not parts[1].strip().isdigit():
+            continue
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(parts[1])
+    if proc.returncode != 0 or cumulative_us is None:
+        errors = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+        raise RuntimeError(f"import {module} не удался:\n" + "\n".join(errors[-5:]))
+    return cumulative_us / 1000, imported
+
+
+def _forbidden(names):
+    return sorted({name for name in names if name.split(".")[0] in FORBIDDEN})
+
+
+def main(budget_ms: float = IMPORT_BUDGET_MS) -> int:
+    ok = True
+
+    leaked = _forbidden(session_imports())
+    if leaked:
+        print(f"⚠️ app.py импортирует при старте: {', '.join(leaked)} — импортируйте лениво")
+        ok = False
+
+    try:
+        results = [measure() for _ in range(RUNS)]
+    except RuntimeError as e:
+        print(f"⚠️ {e}")
+        return 1
+    best_ms = min(ms for ms, _ in results)
+    print(f"import {MODULE}: {best_ms:.0f} мс (бюджет {budget_ms:.0f} мс)")
+    if best_ms > budget_ms:
+        print("⚠️ Бюджет времени импорта превышен")
+        ok = False
+    leaked = _forbidden(results[0][1])
+    if leaked:
+        print(f"⚠️ Лишние зависимости на пути дашборда: {', '.join(leaked)}")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else IMPORT_BUDGET_MS
+    sys.exit(main(budget))
@@ -0,0 +1,297 @@
+# parallel_sync.py
+"""
+Полная пересборка архива в несколько процессов.
+
+Диапазон страниц списка делится на партиции по числу воркеров. Каждый воркер —
+отдельный процесс со своей сессией Parser: берёт страницы из своей партиции
+небольшими порциями, а когда она заканчивается — забирает половину остатка у
+самой загруженной партиции (work stealing). Собранные лоты уходят в очередь
+единственному процессу-писателю, который владеет соединением с SQLite.
+
+Писатель складывает лоты в промежуточную таблицу и подменяет ими lots одной
+транзакцией только после того, как все воркеры отработали без ошибок, —
+упавшая пересборка не трогает текущую базу.
+"""
+import asyncio
+import multiprocessing as mp
+import queue
+import sqlite3
+import time
+
+from db import DB_PATH, create_lots_table, init_db, insert_lots
+from sync import BASE_URL, Parser, write_log
+
+DEFAULT_WORKERS = 3     # не по числу ядер: каждый воркер сам шлёт запросы пачками
+MAX_RPS = 10            # общий лимит запросов в секунду на все процессы (None — без лимита)
+CHUNK_SIZE = 2          # страниц за один захват из партиции
+QUEUE_PER_WORKER = 4    # ограничение очереди к писателю (backpressure)
+PAGE_DELAY = 0.3        # бережный таймаут между страницами внутри воркера
+RETRIES = 3             # попыток на страницу списка, прежде чем считать это ошибкой
+RETRY_DELAY = 1.0       # пауза между попытками (растёт линейно)
+PUT_TIMEOUT = 1.0       # как часто воркер, ждущий место в очереди, проверяет abort
+POLL_INTERVAL = 0.5     # как часто координатор проверяет процессы
+SQLITE_TIMEOUT = 30     # ожидание блокировки, если БД параллельно пишет дашборд
+STAGING_TABLE = "lots_rebuild"
+
+
+class RateLimiter:
+    """Общий для всех процессов лимит запросов: выдаёт слоты раз в 1/max_rps секунды"""
+
+    def __init__(self, ctx, max_rps: float):
+        self.interval = 1 / max_rps
+        self.next_slot = ctx.Value("d", 0.0, lock=False)
+        self.lock = ctx.Lock()
+
+    async def __call__(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.value)
+            self.next_slot.value = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def _probe(parser: Parser, page: int) -> bool:
+    """page_has_announcements с повторами: ошибка сети не должна выглядеть как пустая страница"""
+    for attempt in range(RETRIES):
+        has = await parser.page_has_announcements(page)
+        if has is not None:
+            return has
+        await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+    raise RuntimeError(f"Страница списка {page} не загружается — граница архива не определена")
+
+
+async def find_last_page(base_url: str = BASE_URL, throttle=None) -> int:
+    """Номер последней непустой страницы списка (0 — архив пуст).
+
+    Экспоненциальный поиск границы + бинарный поиск, только по страницам списка.
+    """
+    async with Parser(base_url, throttle) as parser:
+        if not await _probe(parser, 1):
+            return 0
+        lo = 1
+        while await _probe(parser, lo * 2):
+            lo *= 2
+        hi = lo * 2  # заведомо пустая
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if await _probe(parser, mid):
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+
+def split_pages(first: int, last: int, parts: int):
+    """Делим [first, last] на parts смежных полуинтервалов [lo, hi)"""
+    total = max(last - first + 1, 0)
+    bounds = []
+    start = first
+    for i in range(parts):
+        size = total // parts + (1 if i < total % parts else 0)
+        bounds.append((start, start + size))
+        start += size
+    return bounds
+
+
+def _take_pages(worker_id, lo, hi, lock, chunk_size):
+    """Следующая порция страниц [start, end) для воркера или None, если работы нет"""
+    with lock:
+        if lo[worker_id] >= hi[worker_id]:
+            # Своя партиция кончилась — крадём верхнюю половину у самой загруженной
+            victim = max(range(len(lo)), key=lambda i: hi[i] - lo[i])
+            remaining = hi[victim] - lo[victim]
+            if remaining <= 0:
+                return None
+            mid = hi[victim] - (remaining + 1) // 2
+            lo[worker_id], hi[worker_id] = mid, hi[victim]
+            hi[victim] = mid
+        start = lo[worker_id]
+        end = min(start + chunk_size, hi[worker_id])
+        lo[worker_id] = end
+        return start, end
+
+
+def _put(lots_queue, lots, abort):
+    """put с таймаутом: если писатель умер, воркер не должен висеть на полной очереди"""
+    while not abort.is_set():
+        try:
+            lots_queue.put(lots, timeout=PUT_TIMEOUT)
+            return
+        except queue.Full:
+            continue
+    raise RuntimeError("Пересборка прервана: процесс записи в БД остановлен")
+
+
+async def _collect_page(parser: Parser, page: int):
+    """Все лоты страницы списка; страница собирается заново, пока не загрузится целиком.
+
+    Внутри найденной границы пустая страница — это сбой загрузки, а не конец архива.
+    Пропущенное объявление или вкладка лотов видны по приросту parser.failed_fetches.
+    """
+    for attempt in range(RETRIES):
+        failed_before = parser.failed_fetches
+        anns = await parser.parse_page(page)
+        if anns:
+            lots_lists = await asyncio.gather(*[parser.parse_lots(ann) for ann in anns])
+            if parser.failed_fetches == failed_before:
+                return [lot for lots in lots_lists for lot in lots]
+        await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+    raise RuntimeError(f"Страница списка {page} не загружается целиком")
+
+
+async def _crawl(worker_id, lo, hi, lock, chunk_size, base_url, lots_queue, abort, throttle):
+    async with Parser(base_url, throttle) as parser:
+        while not abort.is_set():
+            pages = _take_pages(worker_id, lo, hi, lock, chunk_size)
+            if pages is None:
+                break
+            for page in range(*pages):
+                lots = await _collect_page(parser, page)
+                if lots:
+                    _put(lots_queue, lots, abort)
+                await asyncio.sleep(PAGE_DELAY)
+
+
+def _worker(worker_id, lo, hi, lock, chunk_size, base_url, lots_queue, abort, throttle):
+    asyncio.run(_crawl(worker_id, lo, hi, lock, chunk_size, base_url, lots_queue, abort, throttle))
+
+
+def _writer(lots_queue, written, abort):
+    """Единственный владелец соединения с БД.
+
+    Пишет пачки в промежуточную таблицу; по сигналу None (все воркеры готовы)
+    подменяет ею lots одной транзакцией. При любой ошибке поднимает abort.
+    """
+    try:
+        init_db()
+        conn = sqlite3.connect(DB_PATH, timeout=SQLITE_TIMEOUT)
+        conn.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+        create_lots_table(conn, STAGING_TABLE)
+        conn.commit()
+        while True:
+            lots = lots_queue.get()
+            if lots is None:
+                break
+            insert_lots(lots, conn, STAGING_TABLE)
+        count = conn.execute(f"SELECT COUNT(*) FROM {STAGING_TABLE}").fetchone()[0]
+        conn.execute("DELETE FROM lots")
+        conn.execute(f"INSERT INTO lots SELECT * FROM {STAGING_TABLE}")
+        conn.execute(f"DROP TABLE {STAGING_TABLE}")
+        conn.commit()
+        conn.close()
+        written.value = count
+    except BaseException:
+        abort.set()
+        raise
+
+
+def _supervise(procs, writer, abort):
+    """Ждём воркеров, не блокируясь на join: текст ошибки или None, если все успешны"""
+    while True:
+        if abort.is_set() or writer.exitcode is not None:
+            abort.set()
+            return "Процесс записи в БД завершился с ошибкой"
+        failed = [i for i, p in enumerate(procs) if p.exitcode not in (None, 0)]
+        if failed:
+            abort.set()
+            return f"Воркеры {failed} завершились с ошибкой"
+        if all(p.exitcode == 0 for p in procs):
+            return None
+        time.sleep(POLL_INTERVAL)
+
+
+def _finish_writer(lots_queue, writer):
+    """Сигнал писателю подменить таблицу; текст ошибки или None"""
+    while writer.exitcode is None:
+        try:
+            lots_queue.put(None, timeout=PUT_TIMEOUT)
+            break
+        except queue.Full:
+            continue
+    writer.join()
+    if writer.exitcode != 0:
+        return "Процесс записи в БД завершился с ошибкой"
+    return None
+
+
+def run_partitioned_full_parser(workers: int = DEFAULT_WORKERS, last_page: int = None,
+                                chunk_size: int = CHUNK_SIZE, base_url: str = BASE_URL,
+                                max_rps: float = MAX_RPS):
+    """
+    Полное обновление в workers процессов. Аналог run_full_parser, но синхронный:
+    возвращает (число записанных лотов, путь к логу).
+
+    last_page можно передать явно, иначе граница архива определяется заранее
+    по страницам списка. max_rps — общий лимит запросов на все процессы:
+    ускорение растёт с числом воркеров, пока не упрётся в него.
+    При любой ошибке пишет её в лог, оставляет базу как была и бросает RuntimeError.
+    """
+    mode = f"полный ({workers} процессов)"
+
+    # Пустой диапазон страниц дал бы «успешную» пересборку пустой таблицей
+    if workers < 1 or (last_page is not None and last_page < 1):
+        error = f"Некорректные параметры: workers={workers}, last_page={last_page} — база не тронута"
+        log_path = write_log(mode, 0, error)
+        raise RuntimeError(f"{error}. Лог: {log_path}")
+
+    # spawn — одинаково на Linux и Windows, без наследования event loop/сессий
+    ctx = mp.get_context("spawn")
+    throttle = RateLimiter(ctx, max_rps) if max_rps else None
+
+    if last_page is None:
+        try:
+            last_page = asyncio.run(find_last_page(base_url, throttle))
+        except RuntimeError as e:
+            log_path = write_log(mode, 0, str(e))
+            raise RuntimeError(f"{e}. Лог: {log_path}") from e
+        if last_page == 0:
+            error = "На первой странице списка нет объявлений — база не тронута"
+            log_path = write_log(mode, 0, error)
+            raise RuntimeError(f"{error}. Лог: {log_path}")
+
+    bounds = split_pages(1, last_page, workers)
+    lock = ctx.Lock()
+    lo = ctx.Array("i", [b[0] for b in bounds], lock=False)
+    hi = ctx.Array("i", [b[1] for b in bounds], lock=False)
+    lots_queue = ctx.Queue(maxsize=workers * QUEUE_PER_WORKER)
+    written = ctx.Value("i", 0)
+    abort = ctx.Event()
+
+    writer = ctx.Process(target=_writer, args=(lots_queue, written, abort))
+    procs = [
+        ctx.Process(target=_worker,
+                    args=(i, lo, hi, lock, chunk_size, base_url, lots_queue, abort, throttle))
+        for i in range(workers)
+    ]
+    error = "Пересборка прервана"
+    try:
+        writer.start()
+        for p in procs:
+            p.start()
+        error = _supervise(procs, writer, abort) or _finish_writer(lots_queue, writer)
+    finally:
+        for p in procs + [writer]:
+            if p.pid is None:
+                continue
+            if p.is_alive():
+                p.terminate()
+            p.join()
+        # Данные либо уже приняты писателем, либо больше не нужны
+        lots_queue.cancel_join_thread()
+        if error:
+            log_path = write_log(mode, 0, error)
+
+    if error:
+        raise RuntimeError(f"{error}. Лог: {log_path}")
+    log_path = write_log(mode, written.value)
+    return written.value, log_path
+
+
+if __name__ == "__main__":
+    import sys
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_WORKERS
+    last_page = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    count, log_path = run_partitioned_full_parser(workers, last_page)
+    print(f"Записано лотов: {count}. Лог: {log_path}")
@@ -0,0 +1,45 @@
+# queries.py
+"""
+Лёгкий доступ к БД только на чтение — для дашборда.
+
+Без зависимостей парсера и экспорта и без побочных эффектов при импорте:
+соединение открывается в режиме read-only, таблица и каталог не создаются.
+"""
+import os
+import sqlite3
+import pandas as pd
+
+from db import DB_PATH
+
+LOT_COLUMNS = [
+    "plan_point_id", "lot_id", "ann_id", "title", "customer", "description",
+    "item_type", "unit", "quantity", "price", "amount",
+    "date_start", "date_end", "method", "status",
+]
+
+def connect_readonly():
+    return sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+
+def load_all_lots() -> pd.DataFrame:
+    # БД ещё не собрана — пустая таблица с нужными колонками
+    if not os.path.exists(DB_PATH):
+        return pd.DataFrame(columns=LOT_COLUMNS)
+    conn = connect_readonly()
+    try:
+        return pd.read_sql("SELECT * FROM lots ORDER BY ann_id, plan_point_id", conn)
+    except pd.errors.DatabaseError:
+        return pd.DataFrame(columns=LOT_COLUMNS)
+    finally:
+        conn.close()
+
+def get_last_update_date():
+    if not os.path.exists(DB_PATH):
+        return None
+    conn = connect_readonly()
+    try:
+        result = conn.execute("SELECT MAX(date_end) FROM lots").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+    return result[0] if result else None
@@ -0,0 +1,130 @@
+# standin_server.py
+"""
+Локальная заглушка med.ecc.kz для проверки и замеров парсера.
+
+Отдаёт те же три вида страниц, что разбирает Parser: список объявлений
+/searchanno?page=N, общие сведения /ru/announce/index/<id> и вкладку лотов
+/ru/announce/index/<id>?tab=lots&page=N. Данные детерминированные, каждый ответ
+задерживается на latency секунд — как сетевая задержка реального сайта.
+Для проверки сбоев страницы отдельных объявлений можно сделать недоступными (503).
+
+    python standin_server.py [порт]
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PAGES = 8               # страниц в списке объявлений
+ANNS_PER_PAGE = 10      # объявлений на странице списка
+LOTS_PER_ANN = 25       # лотов в объявлении
+LOTS_PER_PAGE = 10      # лотов на странице вкладки «Лоты»
+LATENCY = 0.05          # задержка ответа, сек
+
+
+def _ann_id(page: int, row: int) -> str:
+    return str(100000 + (page - 1) * ANNS_PER_PAGE + row)
+
+
+def _table(css_class: str, header: list, rows: list) -> str:
+    cells = "".join(f"<th>{h}</th>" for h in header)
+    body = "".join("<tr>" + "".join(f"<td>{c}</td>" for c in row) + "</tr>" for row in rows)
+    return f'<html><body><table class="{css_class}"><tr>{cells}</tr>{body}</table></body></html>'
+
+
+def listing_page(page: int) -> str:
+    rows = []
+    if 1 <= page <= PAGES:
+        for row in range(ANNS_PER_PAGE):
+            ann_id = _ann_id(page, row)
+            rows.append([
+                ann_id, f"Организатор {ann_id}",
+                f'<a href="/ru/announce/index/{ann_id}">Объявление {ann_id}</a>',
+                "Запрос ценовых предложений", "Товар",
+                "01.01.2025", "15.01.2025", LOTS_PER_ANN, f"{LOTS_PER_ANN * 1000}",
+                "Завершено",
+            ])
+    header = ["№", "Организатор", "Наименование", "Способ", "Вид", "Начало",
+              "Окончание", "Лотов", "Сумма", "Статус"]
+    return _table("table", header, rows)
+
+
+def info_page(ann_id: str) -> str:
+    return _table("table-bordered", ["Поле", "Значение"],
+                  [["Кол-во лотов в объявлении", LOTS_PER_ANN]])
+
+
+def lots_page(ann_id: str, page: int) -> str:
+    first = (page - 1) * LOTS_PER_PAGE
+    rows = [
+        [n + 1, f"Заказчик {ann_id}", f"Лот {n + 1}", f"Характеристика {n + 1}",
+         "Товар", "шт", "10", "100", "1 000"]
+        for n in range(first, min(first + LOTS_PER_PAGE, LOTS_PER_ANN))
+    ]
+    header = ["№", "Заказчик", "Наименование", "Характеристика", "Вид", "Ед.",
+              "Кол-во", "Цена", "Сумма"]
+    return _table("table table-striped", header, rows)
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    latency = LATENCY
+    # ann_id -> сколько ещё раз отвечать 503 на его страницы (float("inf") — всегда)
+    unavailable = {}
+    lock = threading.Lock()
+
+    def _take_failure(self, ann_id: str) -> bool:
+        with self.lock:
+            left = self.unavailable.get(ann_id, 0)
+            if left > 0:
+                self.unavailable[ann_id] = left - 1
+                return True
+            return False
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        page = int(query.get("page", ["1"])[0])
+        if url.path == "/searchanno":
+            html = listing_page(page)
+        elif url.path.startswith("/ru/announce/index/"):
+            ann_id = url.path.rsplit("/", 1)[-1]
+            if self._take_failure(ann_id):
+                self.send_error(503)
+                return
+            if query.get("tab") == ["lots"]:
+                html = lots_page(ann_id, page)
+            else:
+                html = info_page(ann_id)
+        else:
+            self.send_error(404)
+            return
+        time.sleep(self.latency)
+        body = html.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(port: int = 0, unavailable: dict = None):
+    """Запуск в фоновом потоке; возвращает (server, base_url). Остановка — server.shutdown()
+
+    unavailable — {ann_id: число ответов 503} для страниц объявления и его лотов.
+    """
+    handler = type("Handler", (StandinHandler,), {"unavailable": dict(unavailable or {})})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    import sys
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    server = ThreadingHTTPServer(("127.0.0.1", port), StandinHandler)
+    print(f"Заглушка на http://127.0.0.1:{port}")
+    server.serve_forever()
@@ -3,11 +3,9 @@ import random
 import aiohttp
 from bs4 import BeautifulSoup
 from typing import List, Dict
-from db import init_db, insert_lot, lot_exists
 import os
 from datetime import datetime
-import pandas as pd
-from db import init_db, insert_lot, lot_exists, clear_db, load_all_lots
+from db import init_db, insert_lot, lot_exists, clear_db, count_lots
 
 BASE_URL = "https://med.ecc.kz"
 USER_AGENTS = [
@@ -16,8 +14,9 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
 ]
 REQUEST_DELAY = (0.1, 0.3)
+ANN_COLUMNS = 10  # колонок в строке объявления на странице списка (parse_page читает cols[9])
 
-def write_log(mode: str, new_count: int):
+def write_log(mode: str, new_count: int, error: str = None):
     """Пишем агрегированный лог в logs/ДДММГГ-ЧЧ.ММ.txt"""
     now = datetime.now()
     log_dir = "logs"
@@ -25,16 +24,24 @@ def write_log(mode: str, new_count: int):
     log_name = now.strftime("%d%m%y-%H.%M") + ".txt"
     log_path = os.path.join(log_dir, log_name)
 
-    total = len(load_all_lots())
+    total = count_lots()
     with open(log_path, "w", encoding="utf-8") as f:
         f.write(f"Дата и время запуска: {now.strftime('%d.%m.%Y %H:%M')}\n")
         f.write(f"Режим: {mode}\n")
         f.write(f"Добавлено новых лотов: {new_count}\n")
         f.write(f"Итого лотов в базе: {total}\n")
+        if error:
+            f.write(f"Ошибка: {error}\n")
     return log_path
 
 class Parser:
-    def __init__(self):
+    def __init__(self, base_url: str = BASE_URL, throttle=None):
+        self.base_url = base_url
+        # throttle — async-функция, которую ждём перед каждым запросом (общий лимит)
+        self.throttle = throttle
+        # Сбои загрузки объявлений и вкладок лотов: по приросту счётчика видно,
+        # что страница собрана не полностью
+        self.failed_fetches = 0
         self.session = None
 
     async def __aenter__(self):
@@ -47,6 +54,8 @@ class Parser:
             await self.session.close()
 
     async def fetch(self, url: str):
+        if self.throttle:
+            await self.throttle()
         try:
             async with self.session.get(url, timeout=20) as r:
                 r.raise_for_status()
@@ -55,19 +64,34 @@ class Parser:
         except:
             return None
 
-    async def parse_page(self, page: int) -> List[Dict]:
-        url = f"{BASE_URL}/searchanno?page={page}"
-        soup = await self.fetch(url)
+    async def fetch_listing(self, page: int):
+        """Ячейки строк объявлений со страницы списка (без захода в объявления).
+        None — страница не загрузилась (ошибка сети), [] — объявлений на ней нет.
+        """
+        soup = await self.fetch(f"{self.base_url}/searchanno?page={page}")
         if not soup:
-            return []
+            return None
         table = soup.find("table", class_="table")
         if not table:
             return []
+        rows = [row.find_all("td") for row in table.find_all("tr")[1:]]
+        return [cols for cols in rows if len(cols) >= ANN_COLUMNS]
+
+    async def page_has_announcements(self, page: int):
+        """Лёгкая проверка: есть ли на странице списка хоть одно объявление.
+        None — страница не загрузилась (ошибка сети), это не то же самое, что пустая.
+        """
+        rows = await self.fetch_listing(page)
+        if rows is None:
+            return None
+        return bool(rows)
+
+    async def parse_page(self, page: int) -> List[Dict]:
+        rows = await self.fetch_listing(page)
+        if not rows:
+            return []
         announcements = []
-        for row in table.find_all("tr")[1:]:
-            cols = row.find_all("td")
-            if len(cols) < 9:
-                continue
+        for cols in rows:
             try:
                 ann_id = cols[0].text.strip()
                 ann = {
@@ -81,12 +105,16 @@ class Parser:
                     "lots": int(cols[7].text.strip()),
                     "amount": float(cols[8].text.strip().replace(" ", "")),
                     "status": cols[9].text.strip(),
-                    "link": BASE_URL + cols[2].find("a")["href"]
+                    "link": self.base_url + cols[2].find("a")["href"]
                 }
                 # --- Парсим Кол-во лотов из Общих сведений ---
-                url_info = f"{BASE_URL}/ru/announce/index/{ann_id}"
+                url_info = f"{self.base_url}/ru/announce/index/{ann_id}"
                 soup_info = await self.fetch(url_info)
                 await asyncio.sleep(random.uniform(*REQUEST_DELAY))
+                if not soup_info:
+                    self.failed_fetches += 1
+                    print(f"[{ann_id}] Нет ответа/ошибка на странице объявления — пропуск.")
+                    continue
                 def extract_field(label):
                     cell = soup_info.find("td", string=lambda t: t and label in t)
                     if cell and cell.find_next_sibling("td"):
@@ -113,6 +141,7 @@ class Parser:
             soup = await self.fetch(url)
             await asyncio.sleep(random.uniform(*REQUEST_DELAY))
             if not soup:
+                self.failed_fetches += 1
                 print(f"[{ann['ann_id']}] Нет ответа/ошибка на странице {page} — остановка.")
                 break
             table = soup.find("table", class_="table-striped")
@@ -158,22 +187,13 @@ class Parser:
             print(f"[{ann['ann_id']}] Достигнут лимит страниц лотов ({max_pages}), собрано {len(result)}")
         return result
 
-def clear_db():
-    import sqlite3
-    from db import DB_PATH
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("DELETE FROM lots")
-    conn.commit()
-    conn.close()
-
 async def run_full_parser():
     """
     Полное обновление: очищаем БД и парсим ВСЕ страницы, пока не встретим пустую.
     Никакого max_pages — идём до конца архива.
     """
-    clear_db()
     init_db()
+    clear_db()
 
     new_lots = []
     page = 1
@@ -197,7 +217,6 @@ async def run_full_parser():
     return new_lots, log_path
 
 async def run_incremental_parser(max_pages: int):
-    from db import lot_exists
     init_db()
     new_lots = []
     stop = False